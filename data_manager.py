@@ -12,12 +12,35 @@ import json
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 모듈을 사용합니다.
+    orjson = None
+
 # 데이터 저장 경로 설정
 DATA_DIR = "data"
 ALL_TICKETS_FILE = os.path.join(DATA_DIR, "all_tickets.json")
 SENT_NOTIFICATIONS_FILE = os.path.join(DATA_DIR, "sent_notifications.json")
 CONFIG_FILE = os.path.join(DATA_DIR, "config.json")
 
+def json_dumps(obj, indent=False):
+    """
+    객체를 UTF-8 JSON 바이트로 직렬화합니다. orjson이 있으면 orjson을 사용합니다.
+    비ASCII 문자는 이스케이프하지 않으며, indent가 참이면 2칸 들여쓰기로 저장합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+def json_loads(data):
+    """
+    JSON 바이트를 파싱합니다. orjson이 있으면 orjson을 사용합니다.
+    형식 오류는 어느 쪽이든 json.JSONDecodeError로 잡을 수 있습니다. (orjson.JSONDecodeError는 그 하위 클래스입니다)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def ensure_data_directory():
     """
     데이터 저장을 위한 'data' 폴더가 있는지 확인하고, 없으면 생성합니다.
@@ -67,8 +90,8 @@ def save_tickets(tickets, filename=ALL_TICKETS_FILE):
     """
     try:
         ensure_data_directory()
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(tickets, f, ensure_ascii=False, indent=2)
+        with open(filename, "wb") as f:
+            f.write(json_dumps(tickets, indent=True))
         logging.info(f"티켓 정보가 '{filename}' 파일에 성공적으로 저장되었습니다. (총 {len(tickets)}건)")
         return True
     except Exception as e:
@@ -86,8 +109,8 @@ def load_tickets(filename=ALL_TICKETS_FILE):
         list: 로드된 티켓 정보 목록 (파일이 없으면 빈 리스트 반환)
     """
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            tickets = json.load(f)
+        with open(filename, "rb") as f:
+            tickets = json_loads(f.read())
         logging.info(f"'{filename}' 파일에서 티켓 정보를 성공적으로 로드했습니다. (총 {len(tickets)}건)")
         return tickets
     except FileNotFoundError:
@@ -9,6 +9,8 @@
 """
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import time
 import os
@@ -17,6 +19,35 @@ import re
 import hashlib
 from typing import List, Dict, Any, Optional, Set
 
+# 디스코드 웹훅 메시지 하나에 담을 수 있는 최대 임베드 수
+MAX_EMBEDS_PER_MESSAGE = 10
+
+# 티켓 제목 키워드에 따른 이모지 (앞에서부터 먼저 일치하는 항목을 사용)
+TICKET_EMOJI_KEYWORDS = (
+    ("🎵", ('콘서트', '공연', '라이브')),
+    ("🎭", ('뮤지컬', '연극', '오페라')),
+    ("⚽", ('스포츠', '야구', '축구', '농구')),
+    ("🎨", ('전시', '박람회', '페스티벌')),
+)
+DEFAULT_TICKET_EMOJI = "🎫"
+
+# 소스별 임베드 색상 (우선순위 티켓 색상, 일반 티켓 색상) - 우선순위 티켓은 더 밝은 색상
+SOURCE_COLORS = {
+    "인터파크": (0x0099FF, 0x0066CC),  # 파란색
+    "YES24": (0x00FF66, 0x00CC44),    # 녹색
+    "멜론티켓": (0x66FF00, 0x44CC00),  # 연두색
+    "티켓링크": (0xFF6600, 0xCC4400)   # 주황색
+}
+DEFAULT_COLORS = (0xFF0000, 0x808080)
+
+# 소스별 임베드 썸네일
+SOURCE_THUMBNAILS = {
+    "인터파크": "https://i.imgur.com/interpark_icon.png",  # 실제 아이콘 URL로 교체 필요
+    "YES24": "https://i.imgur.com/yes24_icon.png",
+    "멜론티켓": "https://i.imgur.com/melon_icon.png",
+    "티켓링크": "https://i.imgur.com/ticketlink_icon.png"
+}
+
 class DiscordNotifier:
     def __init__(self, webhook_url: str, keywords: Optional[List[str]] = None, priority_keywords: Optional[List[str]] = None):
         """
@@ -30,6 +61,10 @@ class DiscordNotifier:
         self.webhook_url = webhook_url
         self.keywords = keywords or []
         self.priority_keywords = priority_keywords or []
+        # 티켓마다 키워드를 다시 소문자로 바꾸지 않도록 미리 변환해 둡니다.
+        self._lowered_keywords = tuple(keyword.lower() for keyword in self.keywords)
+        self._lowered_priority_keywords = tuple(keyword.lower() for keyword in self.priority_keywords)
+        self.session = self._create_session()
         self.sent_notifications = self._load_sent_notifications()
         self.notification_history = self._load_notification_history()
         
@@ -37,6 +72,28 @@ class DiscordNotifier:
         self.ticket_hashes: Set[str] = set()
         self._load_ticket_hashes()
     
+    def _create_session(self) -> requests.Session:
+        """
+        웹훅 전송에 재사용할 HTTP 세션을 생성합니다.
+        연결을 유지(keep-alive)하여 알림마다 TLS 핸드셰이크를 반복하지 않고,
+        429 응답은 Retry-After 헤더를 존중하며 자동으로 재시도합니다.
+        요청이 이미 전달되었을 수 있는 읽기 오류·타임아웃은 중복 알림을 막기 위해 재시도하지 않습니다.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            connect=3,
+            read=0,
+            other=0,
+            status=3,
+            status_forcelist=(429,),
+            allowed_methods=frozenset({'POST'}),
+            backoff_factor=1,
+            raise_on_status=False
+        )
+        session.mount('https://', HTTPAdapter(max_retries=retry))
+        return session
+    
     def _load_sent_notifications(self) -> Dict[str, Any]:
         """이전에 전송한 알림 기록을 로드합니다."""
         notifications_file = os.path.join('data', 'sent_notifications.json')
@@ -139,12 +196,13 @@ class DiscordNotifier:
         # 둘 중 하나라도 이미 존재하면 중복으로 판단
         return legacy_id not in self.sent_notifications and ticket_hash not in self.ticket_hashes
     
-    def mark_as_sent(self, ticket: Dict[str, Any]):
+    def mark_as_sent(self, ticket: Dict[str, Any], persist: bool = True):
         """
         티켓을 전송 완료로 표시합니다.
         
         Args:
             ticket: 티켓 정보
+            persist: 기록 파일에 즉시 저장할지 여부 (배치 전송 시에는 마지막에 한 번만 저장)
         """
         ticket_id = f"{ticket.get('source', '')}_{ticket.get('title', '')}_{ticket.get('open_date', '')}"
         ticket_hash = self._generate_ticket_hash(ticket)
@@ -164,16 +222,21 @@ class DiscordNotifier:
         self.notification_history['daily_counts'][today] += 1
         self.notification_history['total_sent'] = self.notification_history.get('total_sent', 0) + 1
         
+        if persist:
+            self.save_state()
+    
+    def save_state(self):
+        """전송 기록과 알림 이력을 파일에 저장합니다."""
         self._save_sent_notifications()
         self._save_notification_history()
     
-    def _check_priority(self, ticket: Dict[str, Any]) -> bool:
+    def is_priority_ticket(self, ticket: Dict[str, Any]) -> bool:
         """티켓이 우선순위 키워드를 포함하는지 확인합니다."""
         if not self.priority_keywords:
             return False
         
         title = ticket.get('title', '').lower()
-        return any(keyword.lower() in title for keyword in self.priority_keywords)
+        return any(keyword in title for keyword in self._lowered_priority_keywords)
     
     def _format_open_date(self, open_date: str) -> str:
         """오픈 날짜를 보기 좋게 포맷팅합니다."""
@@ -201,16 +264,10 @@ class DiscordNotifier:
         """티켓 유형에 따른 이모지를 반환합니다."""
         title = ticket.get('title', '').lower()
         
-        if any(keyword in title for keyword in ['콘서트', '공연', '라이브']):
-            return "🎵"
-        elif any(keyword in title for keyword in ['뮤지컬', '연극', '오페라']):
-            return "🎭"
-        elif any(keyword in title for keyword in ['스포츠', '야구', '축구', '농구']):
-            return "⚽"
-        elif any(keyword in title for keyword in ['전시', '박람회', '페스티벌']):
-            return "🎨"
-        else:
-            return "🎫"
+        for emoji, keywords in TICKET_EMOJI_KEYWORDS:
+            if any(keyword in title for keyword in keywords):
+                return emoji
+        return DEFAULT_TICKET_EMOJI
     
     def create_embed(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -224,17 +281,11 @@ class DiscordNotifier:
             디스코드 임베드 메시지
         """
         # 소스별 색상 설정 (우선순위 티켓은 더 밝은 색상)
-        is_priority = self._check_priority(ticket)
-        
-        color_map = {
-            "인터파크": 0x0099FF if is_priority else 0x0066CC,  # 파란색
-            "YES24": 0x00FF66 if is_priority else 0x00CC44,    # 녹색
-            "멜론티켓": 0x66FF00 if is_priority else 0x44CC00,  # 연두색
-            "티켓링크": 0xFF6600 if is_priority else 0xCC4400   # 주황색
-        }
+        is_priority = self.is_priority_ticket(ticket)
         
         source = ticket.get('source', '알 수 없음')
-        color = color_map.get(source, 0xFF0000 if is_priority else 0x808080)
+        priority_color, normal_color = SOURCE_COLORS.get(source, DEFAULT_COLORS)
+        color = priority_color if is_priority else normal_color
         
         # 티켓 제목에 이모지 추가
         emoji = self._get_ticket_emoji(ticket)
@@ -258,43 +309,33 @@ class DiscordNotifier:
         description = "\n".join(description_parts)
         
         # 푸터 텍스트 개선
-        footer_text = f"출처: {source} | 알림: {datetime.now().strftime('%m/%d %H:%M')}"
+        now = datetime.now()
+        footer_text = f"출처: {source} | 알림: {now.strftime('%m/%d %H:%M')}"
         if is_priority:
             footer_text += " | ⭐ 우선순위 알림"
         
         embed = {
             "title": title,
             "description": description,
-            "url": ticket.get('link', ''),
             "color": color,
             "footer": {
                 "text": footer_text
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
         
-        # 썸네일 추가 (소스별)
-        thumbnail_map = {
-            "인터파크": "https://i.imgur.com/interpark_icon.png",  # 실제 아이콘 URL로 교체 필요
-            "YES24": "https://i.imgur.com/yes24_icon.png",
-            "멜론티켓": "https://i.imgur.com/melon_icon.png",
-            "티켓링크": "https://i.imgur.com/ticketlink_icon.png"
-        }
+        # '링크 없음' 같은 자리표시자를 url로 보내면 디스코드가 메시지 전체를 거부(400)하므로 실제 URL만 넣습니다.
+        link = ticket.get('link', '')
+        if link.startswith('http'):
+            embed["url"] = link
         
-        if source in thumbnail_map:
-            embed["thumbnail"] = {"url": thumbnail_map[source]}
+        # 썸네일 추가 (소스별)
+        thumbnail_url = SOURCE_THUMBNAILS.get(source)
+        if thumbnail_url:
+            embed["thumbnail"] = {"url": thumbnail_url}
         
         return embed
     
-    def _create_notification_content(self, ticket: Dict[str, Any]) -> str:
-        """알림 메시지의 컨텐츠를 생성합니다."""
-        is_priority = self._check_priority(ticket)
-        
-        if is_priority:
-            return "🚨 **우선순위 티켓 오픈 알림** 🚨"
-        else:
-            return "🎫 **새로운 티켓 오픈 정보** 🎫"
-    
     def _should_send_notification(self, ticket: Dict[str, Any]) -> bool:
         """알림을 전송해야 하는지 확인합니다."""
         # 새로운 티켓인지 확인
@@ -304,77 +345,98 @@ class DiscordNotifier:
         # 키워드 필터링 (키워드가 설정된 경우)
         if self.keywords:
             title = ticket.get('title', '').lower()
-            if not any(keyword.lower() in title for keyword in self.keywords):
+            if not any(keyword in title for keyword in self._lowered_keywords):
                 logging.info(f"키워드 필터링으로 제외된 티켓: {ticket.get('title', '')}")
                 return False
         
         return True
     
-    def send_notification(self, ticket: Dict[str, Any]) -> bool:
+    def _post_payload(self, payload: Dict[str, Any], description: str) -> Optional[int]:
         """
-        디스코드로 알림을 전송합니다.
-        향상된 필터링과 우선순위 처리를 포함합니다.
+        웹훅으로 메시지를 전송합니다.
+        속도 제한(429) 재시도는 세션 어댑터가 담당하므로, 재시도 후에도 429이면 실패로 처리합니다.
         
         Args:
-            ticket: 티켓 정보
+            payload: 웹훅 요청 본문
+            description: 로그에 표시할 전송 대상 설명
             
         Returns:
-            전송 성공 여부
+            응답 상태 코드 (타임아웃 등으로 응답을 받지 못하면 None)
         """
-        if not self._should_send_notification(ticket):
-            return False
-        
-        embed = self.create_embed(ticket)
-        content = self._create_notification_content(ticket)
-        
-        payload = {
-            "content": content,
-            "embeds": [embed]
-        }
-        
-        # 우선순위 티켓의 경우 @everyone 멘션 추가 (선택사항)
-        is_priority = self._check_priority(ticket)
-        if is_priority:
-            payload["content"] = f"@here {content}"  # @everyone 대신 @here 사용 (온라인 사용자만)
-        
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=10  # 타임아웃 설정
             )
             response.raise_for_status()
-            
-            # 전송 성공 시 기록
-            self.mark_as_sent(ticket)
-            
-            priority_text = " (우선순위)" if is_priority else ""
-            logging.info(f"알림 전송 성공{priority_text}: {ticket.get('title', '')}")
-            return True
+            return response.status_code
             
         except requests.exceptions.Timeout:
-            logging.error(f"알림 전송 타임아웃: {ticket.get('title', '')}")
-            return False
+            logging.error(f"알림 전송 타임아웃: {description}")
+            return None
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:  # Rate limit
-                logging.warning(f"디스코드 API 속도 제한 도달. 잠시 대기 후 재시도합니다.")
-                time.sleep(5)
-                return self.send_notification(ticket)  # 재시도
+                logging.error(f"디스코드 API 속도 제한이 재시도 후에도 풀리지 않았습니다: {description}")
             else:
                 logging.error(f"HTTP 오류 발생: {e.response.status_code} - {e}")
-                return False
+            return e.response.status_code
         except Exception as e:
             logging.error(f"알림 전송 중 오류 발생: {e}")
+            return None
+    
+    @staticmethod
+    def _is_success(status: Optional[int]) -> bool:
+        """_post_payload가 반환한 상태 코드가 전송 성공인지 확인합니다."""
+        return status is not None and status < 400
+    
+    def _create_notification_content(self, is_priority: bool) -> str:
+        """메시지 본문을 생성합니다. 우선순위 알림에는 @here 멘션을 붙입니다."""
+        if is_priority:
+            # @everyone 대신 @here 사용 (온라인 사용자만)
+            return "@here 🚨 **우선순위 티켓 오픈 알림** 🚨"
+        return "🎫 **새로운 티켓 오픈 정보** 🎫"
+    
+    def send_notification(self, ticket: Dict[str, Any], persist: bool = True) -> bool:
+        """
+        디스코드로 알림을 전송합니다.
+        향상된 필터링과 우선순위 처리를 포함합니다.
+        
+        Args:
+            ticket: 티켓 정보
+            persist: 전송 기록을 즉시 파일에 저장할지 여부
+            
+        Returns:
+            전송 성공 여부
+        """
+        if not self._should_send_notification(ticket):
             return False
+        
+        is_priority = self.is_priority_ticket(ticket)
+        payload = {
+            "content": self._create_notification_content(is_priority),
+            "embeds": [self.create_embed(ticket)]
+        }
+        
+        if not self._is_success(self._post_payload(payload, ticket.get('title', ''))):
+            return False
+        
+        # 전송 성공 시 기록
+        self.mark_as_sent(ticket, persist=persist)
+        
+        priority_text = " (우선순위)" if is_priority else ""
+        logging.info(f"알림 전송 성공{priority_text}: {ticket.get('title', '')}")
+        return True
     
     def send_batch_notifications(self, tickets: List[Dict[str, Any]], delay: float = 1.0, max_per_batch: int = 10) -> Dict[str, int]:
         """
         여러 티켓 정보를 배치로 전송합니다.
         우선순위 티켓을 먼저 처리하고, 배치 크기를 제한합니다.
+        티켓은 메시지 하나당 최대 10개의 임베드로 묶어 전송합니다.
         
         Args:
             tickets: 티켓 정보 리스트
-            delay: 각 알림 사이의 지연 시간(초)
+            delay: 각 메시지 사이의 지연 시간(초)
             max_per_batch: 한 번에 처리할 최대 티켓 수
             
         Returns:
@@ -388,7 +450,7 @@ class DiscordNotifier:
         normal_tickets = []
         
         for ticket in tickets:
-            if self._check_priority(ticket):
+            if self.is_priority_ticket(ticket):
                 priority_tickets.append(ticket)
             else:
                 normal_tickets.append(ticket)
@@ -397,36 +459,74 @@ class DiscordNotifier:
         priority_tickets.sort(key=lambda x: x.get('open_date', ''))
         normal_tickets.sort(key=lambda x: x.get('open_date', ''))
         
-        # 전체 티켓 목록 (우선순위 먼저)
-        sorted_tickets = priority_tickets + normal_tickets
+        # 배치 크기 제한 (우선순위 티켓 먼저)
+        total_count = len(priority_tickets) + len(normal_tickets)
+        if total_count > max_per_batch:
+            logging.warning(f"티켓 수({total_count})가 배치 제한({max_per_batch})을 초과합니다. 처음 {max_per_batch}개만 처리합니다.")
+            priority_tickets = priority_tickets[:max_per_batch]
+            normal_tickets = normal_tickets[:max_per_batch - len(priority_tickets)]
         
-        # 배치 크기 제한
-        if len(sorted_tickets) > max_per_batch:
-            logging.warning(f"티켓 수({len(sorted_tickets)})가 배치 제한({max_per_batch})을 초과합니다. 처음 {max_per_batch}개만 처리합니다.")
-            sorted_tickets = sorted_tickets[:max_per_batch]
+        logging.info(f"배치 알림 전송 시작: 총 {len(priority_tickets) + len(normal_tickets)}개 (우선순위: {len(priority_tickets)}개, 일반: {len(normal_tickets)}개)")
+        
+        # 이미 전송했거나 키워드에 맞지 않는 티켓은 제외
+        sendable_priority = [t for t in priority_tickets if self._should_send_notification(t)]
+        sendable_normal = [t for t in normal_tickets if self._should_send_notification(t)]
+        skipped_count = len(priority_tickets) + len(normal_tickets) - len(sendable_priority) - len(sendable_normal)
+        
+        # 우선순위별로 최대 10개씩 묶어 메시지 하나로 전송합니다.
+        chunks = [
+            (is_priority, group[i:i + MAX_EMBEDS_PER_MESSAGE])
+            for is_priority, group in ((True, sendable_priority), (False, sendable_normal))
+            for i in range(0, len(group), MAX_EMBEDS_PER_MESSAGE)
+        ]
         
         sent_count = 0
         failed_count = 0
-        skipped_count = 0
         
-        logging.info(f"배치 알림 전송 시작: 총 {len(sorted_tickets)}개 (우선순위: {len(priority_tickets)}개, 일반: {len(normal_tickets)}개)")
-        
-        for i, ticket in enumerate(sorted_tickets, 1):
-            try:
-                if self.send_notification(ticket):
-                    sent_count += 1
-                else:
-                    skipped_count += 1
-                
-                # 마지막 티켓이 아닌 경우에만 지연
-                if i < len(sorted_tickets):
-                    # 우선순위 티켓 간에는 더 짧은 지연
-                    current_delay = delay * 0.5 if ticket in priority_tickets else delay
-                    time.sleep(current_delay)
+        try:
+            for i, (is_priority, chunk) in enumerate(chunks, 1):
+                try:
+                    payload = {
+                        "content": self._create_notification_content(is_priority),
+                        "embeds": [self.create_embed(ticket) for ticket in chunk]
+                    }
                     
-            except Exception as e:
-                logging.error(f"배치 전송 중 오류 발생: {e}")
-                failed_count += 1
+                    # 우선순위 메시지 간에는 더 짧은 지연
+                    current_delay = delay * 0.5 if is_priority else delay
+                    
+                    status = self._post_payload(payload, f"티켓 {len(chunk)}개")
+                    if self._is_success(status):
+                        # 전송 기록은 티켓마다 파일 전체를 다시 쓰지 않고 배치 끝에서 한 번만 저장합니다.
+                        for ticket in chunk:
+                            self.mark_as_sent(ticket, persist=False)
+                        sent_count += len(chunk)
+                        priority_text = " (우선순위)" if is_priority else ""
+                        logging.info(f"알림 전송 성공{priority_text}: {', '.join(t.get('title', '') for t in chunk)}")
+                    elif status == 400 and len(chunk) > 1:
+                        # 임베드 하나가 잘못되면 메시지 전체가 400으로 거부되므로, 문제 티켓 하나 때문에
+                        # 나머지까지 매번 실패하지 않도록 이 메시지의 티켓을 하나씩 다시 전송합니다.
+                        # (401/403/404 등 웹훅 자체의 문제는 개별 전송도 실패하므로 메시지 전체를 실패로 처리합니다)
+                        logging.warning(f"메시지 전송이 거부되어(HTTP {status}) 티켓 {len(chunk)}개를 하나씩 다시 전송합니다.")
+                        for j, ticket in enumerate(chunk, 1):
+                            if self.send_notification(ticket, persist=False):
+                                sent_count += 1
+                            else:
+                                failed_count += 1
+                            if j < len(chunk):
+                                time.sleep(current_delay)
+                    else:
+                        failed_count += len(chunk)
+                    
+                    # 마지막 메시지가 아닌 경우에만 지연
+                    if i < len(chunks):
+                        time.sleep(current_delay)
+                        
+                except Exception as e:
+                    logging.error(f"배치 전송 중 오류 발생: {e}")
+                    failed_count += len(chunk)
+        finally:
+            if sent_count:
+                self.save_state()
         
         result = {
             'sent': sent_count,
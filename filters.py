@@ -10,45 +10,40 @@
 
 import re
 from datetime import datetime
+from functools import lru_cache
 import logging
 
-def parse_date(date_str):
+# 일반적인 날짜 형식에 대한 정규 표현식 패턴 (호출마다 다시 컴파일하지 않도록 미리 컴파일합니다)
+DATE_PATTERNS = [
+    # YYYY.MM.DD HH:MM
+    (re.compile(r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})'), 5),
+    # YYYY.MM.DD
+    (re.compile(r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})'), 3),
+    # MM.DD HH:MM
+    (re.compile(r'(\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})'), 4),
+    # MM월 DD일 HH시 MM분
+    (re.compile(r'(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시\s*(\d{1,2})분'), 4),
+    # MM/DD(요일) HH:MM
+    (re.compile(r'(\d{1,2})/(\d{1,2})(?:\([가-힣]\))?\s*(\d{1,2}):(\d{1,2})'), 4),
+]
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str, current_year):
     """
-    다양한 형식의 날짜 문자열을 파싱하여 datetime 객체로 변환합니다.
-    정확한 시간 정보가 없으면 기본값으로 자정을 사용합니다.
-    
-    Args:
-        date_str (str): 날짜 문자열
-        
-    Returns:
-        datetime: 파싱된 날짜 객체, 파싱 실패 시 datetime.max 반환
+    parse_date의 실제 파싱 로직입니다. 같은 날짜 문자열은 한 번만 파싱하도록 결과를 캐시합니다.
+    연도가 없는 형식은 current_year를 사용하므로, 연도가 바뀌면 캐시 키도 달라집니다.
     """
     try:
-        # 일반적인 날짜 형식에 대한 정규 표현식 패턴
-        patterns = [
-            # YYYY.MM.DD HH:MM
-            (r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})', 5),
-            # YYYY.MM.DD
-            (r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})', 3),
-            # MM.DD HH:MM
-            (r'(\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})', 4),
-            # MM월 DD일 HH시 MM분
-            (r'(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시\s*(\d{1,2})분', 4),
-            # MM/DD(요일) HH:MM
-            (r'(\d{1,2})/(\d{1,2})(?:\([가-힣]\))?\s*(\d{1,2}):(\d{1,2})', 4),
-        ]
-        
-        for pattern, group_count in patterns:
-            match = re.search(pattern, date_str)
+        for pattern, group_count in DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 groups = match.groups()
-                now = datetime.now()
                 if group_count == 5:  # YYYY.MM.DD HH:MM
                     return datetime(int(groups[0]), int(groups[1]), int(groups[2]), int(groups[3]), int(groups[4]))
                 elif group_count == 3:  # YYYY.MM.DD
                     return datetime(int(groups[0]), int(groups[1]), int(groups[2]))
                 elif group_count == 4:  # MM.DD HH:MM or MM월 DD일 HH시 MM분
-                    return datetime(now.year, int(groups[0]), int(groups[1]), int(groups[2]), int(groups[3]))
+                    return datetime(current_year, int(groups[0]), int(groups[1]), int(groups[2]), int(groups[3]))
         
         # 알려진 패턴과 일치하지 않을 경우, 파싱 실패를 알립니다.
         logging.warning(f"날짜 형식을 파싱할 수 없습니다: '{date_str}'")
@@ -57,6 +52,19 @@ def parse_date(date_str):
         logging.error(f"날짜 파싱 중 예외 발생 - {e}, 입력: '{date_str}'")
         return datetime.max
 
+def parse_date(date_str):
+    """
+    다양한 형식의 날짜 문자열을 파싱하여 datetime 객체로 변환합니다.
+    정확한 시간 정보가 없으면 기본값으로 자정을 사용합니다.
+    
+    Args:
+        date_str (str): 날짜 문자열
+        
+    Returns:
+        datetime: 파싱된 날짜 객체, 파싱 실패 시 datetime.max 반환
+    """
+    return _parse_date_cached(date_str, datetime.now().year)
+
 def sort_by_date(tickets):
     """
     티켓 정보를 오픈 날짜순으로 정렬합니다.
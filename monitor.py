@@ -3,17 +3,45 @@
 주기적으로 티켓 사이트를 크롤링하고 새로운 정보를 디스코드로 알림을 보냅니다.
 """
 import time
+import atexit
 import random
 import json
 import os
+import re
 import logging
 import importlib
+import functools
 import concurrent.futures
-from datetime import datetime
-from typing import List, Dict, Any, Callable
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Callable, Tuple, Iterator, Optional, Set
 
+from data_manager import json_dumps, json_loads
 from discord_notifier import DiscordNotifier
 
+# crawlers 패키지에 구현된 전체 크롤러 소스 목록
+ALL_SOURCES = ("interpark", "yes24", "melon", "ticketlink")
+
+# 매 사이클마다 스레드를 새로 만들지 않도록 크롤러 실행용 스레드 풀을 프로세스 전체에서 재사용합니다.
+_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+# 소스별로 마지막에 제출한 크롤러 Future. 제한 시간을 넘겨 아직 실행 중인 크롤러를 다시 제출하지 않는 데 사용합니다.
+_IN_FLIGHT: Dict[str, concurrent.futures.Future] = {}
+
+# 로드에 성공한 소스별 크롤러 함수. 실패한 소스는 저장하지 않아 다음 사이클에 다시 로드를 시도합니다.
+_CRAWLER_FUNCTIONS: Dict[str, Callable[[], List[Dict[str, Any]]]] = {}
+
+
+def _get_executor(max_workers: int = len(ALL_SOURCES)) -> concurrent.futures.ThreadPoolExecutor:
+    """
+    크롤러 실행용 스레드 풀을 반환합니다. 처음 호출될 때 한 번만 생성합니다.
+    크롤러마다 브라우저를 띄우므로 max_workers로 동시에 실행되는 크롤러 수를 제한합니다.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix='crawler')
+        atexit.register(_EXECUTOR.shutdown)
+    return _EXECUTOR
+
 
 def load_config() -> Dict[str, Any]:
     """
@@ -28,8 +56,8 @@ def load_config() -> Dict[str, Any]:
         exit(1)
 
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = json_loads(f.read())
     except json.JSONDecodeError:
         logging.error(f"{config_path} 파일이 올바른 JSON 형식이 아닙니다.")
         exit(1)
@@ -60,17 +88,23 @@ def save_all_tickets(tickets: List[Dict[str, Any]], filename: str = "all_tickets
             os.makedirs('data')
         
         filepath = os.path.join('data', filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({
+        with open(filepath, 'wb') as f:
+            f.write(json_dumps({
                 "last_updated": datetime.now().isoformat(),
                 "count": len(tickets),
                 "tickets": tickets
-            }, f, ensure_ascii=False, indent=2)
+            }, indent=True))
         logging.info(f"{len(tickets)}개의 티켓 정보를 {filepath}에 저장했습니다.")
     except Exception as e:
         logging.error(f"티켓 정보 저장 중 오류 발생: {e}")
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """키워드 목록을 대소문자를 무시하는 하나의 정규식으로 컴파일합니다. 같은 키워드 조합은 한 번만 컴파일합니다."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
 def filter_tickets_by_keyword(tickets: List[Dict[str, Any]], keywords: List[str]) -> List[Dict[str, Any]]:
     """
     키워드로 티켓을 필터링합니다.
@@ -82,20 +116,43 @@ def filter_tickets_by_keyword(tickets: List[Dict[str, Any]], keywords: List[str]
     Returns:
         필터링된 티켓 리스트
     """
-    if not keywords:
+    if not keywords or not tickets:
         return tickets
+
+    # 키워드마다 문자열을 다시 훑지 않도록 모든 키워드를 하나의 정규식으로 묶어 한 번에 검색합니다.
+    pattern = _compile_keyword_pattern(tuple(keywords))
+
+    # 제목과 설명에서 키워드 검색
+    return [
+        ticket for ticket in tickets
+        if pattern.search(f"{ticket.get('title', '')} {ticket.get('description', '')}")
+    ]
+
+
+def deduplicate_tickets(tickets: List[Dict[str, Any]], seen_links: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+    """
+    링크를 기준으로 중복된 티켓을 제거합니다. 먼저 수집된 티켓이 유지됩니다.
     
-    filtered_tickets = []
-    for ticket in tickets:
-        title = ticket.get('title', '').lower()
-        description = ticket.get('description', '').lower()
+    Args:
+        tickets: 티켓 정보 리스트
+        seen_links: 이미 처리한 링크 집합 (여러 번 나누어 호출할 때 공유하며, 호출 중 갱신됩니다)
         
-        # 제목과 설명에서 키워드 검색
-        text_to_search = f"{title} {description}"
-        if any(keyword.lower() in text_to_search for keyword in keywords):
-            filtered_tickets.append(ticket)
+    Returns:
+        중복이 제거된 티켓 리스트
+    """
+    if seen_links is None:
+        seen_links = set()
+    unique_tickets = []
+    for ticket in tickets:
+        link = ticket.get('link', '')
+        # '링크 없음'처럼 실제 URL이 아닌 값은 비교 기준이 될 수 없으므로 그대로 둡니다.
+        if link.startswith('http'):
+            if link in seen_links:
+                continue
+            seen_links.add(link)
+        unique_tickets.append(ticket)
     
-    return filtered_tickets
+    return unique_tickets
 
 
 def setup_discord_notifier(config: Dict[str, Any]) -> DiscordNotifier:
@@ -122,13 +179,17 @@ def setup_discord_notifier(config: Dict[str, Any]) -> DiscordNotifier:
     )
 
 
-def get_crawler_functions(sources: List[str]) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
+def get_crawler_functions(sources: Tuple[str, ...]) -> Dict[str, Callable[[], List[Dict[str, Any]]]]:
     """
     crawlers 패키지에서 사용 가능한 크롤러 함수를 동적으로 로드합니다.
     config.json의 'sources'에 명시된 크롤러만 로드합니다.
+    로드에 성공한 소스는 프로세스당 한 번만 로드하고, 실패한 소스는 호출할 때마다 다시 시도합니다.
     """
     crawler_functions = {}
     for source_name in sources:
+        if source_name in _CRAWLER_FUNCTIONS:
+            crawler_functions[source_name] = _CRAWLER_FUNCTIONS[source_name]
+            continue
         try:
             module_name = f"crawlers.{source_name.lower()}_crawler"
             # ex) crawlers.interpark_crawler
@@ -136,8 +197,9 @@ def get_crawler_functions(sources: List[str]) -> Dict[str, Callable[[], List[Dic
 
             # ex) get_interpark_notices
             func_name = f"get_{source_name.lower()}_notices"
-            if hasattr(module, func_name):
-                crawler_functions[source_name] = getattr(module, func_name)
+            crawler_function = getattr(module, func_name, None)
+            if crawler_function is not None:
+                crawler_functions[source_name] = _CRAWLER_FUNCTIONS[source_name] = crawler_function
             else:
                 logging.warning(f"'{module_name}' 모듈에서 '{func_name}' 함수를 찾을 수 없습니다.")
         except ImportError:
@@ -148,51 +210,117 @@ def get_crawler_functions(sources: List[str]) -> Dict[str, Callable[[], List[Dic
     return crawler_functions
 
 
-def collect_all_tickets(sources: List[str]) -> List[Dict[str, Any]]:
+def iter_collected_tickets(sources: List[str], max_workers: int = len(ALL_SOURCES),
+                           timeout: Optional[float] = None) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
     """
-    모든 소스에서 티켓 정보를 병렬로 수집합니다.
-    concurrent.futures를 사용하여 각 크롤러를 별도의 스레드에서 실행합니다.
+    모든 소스의 크롤러를 병렬로 실행하고, 먼저 끝난 크롤러의 결과부터 (소스, 티켓 리스트)로 내보냅니다.
+    모듈 수준의 스레드 풀에서 각 크롤러를 별도의 스레드로 실행하며, 동시에 실행되는 크롤러는
+    최대 max_workers개입니다. (스레드 풀이 처음 만들어질 때의 값이 적용됩니다)
+    크롤링에 실패한 소스는 오류를 기록하고 건너뜁니다.
+    timeout(초)이 지나도 끝나지 않은 소스는 이번 사이클에서 제외하며, 이전 사이클의 크롤러가
+    아직 실행 중인 소스는 같은 사이트를 동시에 두 번 크롤링하지 않도록 다시 실행하지 않습니다.
     """
-    all_tickets = []
-    crawler_functions = get_crawler_functions(sources)
+    crawler_functions = get_crawler_functions(tuple(sources))
 
     if not crawler_functions:
         logging.error("실행할 크롤러를 찾지 못했습니다. config.json의 'sources' 설정을 확인하세요.")
-        return []
+        return
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=len(crawler_functions)) as executor:
-        # 각 크롤러 함수를 실행하고 Future 객체를 딕셔너리에 저장
-        future_to_source = {executor.submit(func): source for source, func in crawler_functions.items()}
-        
-        for future in concurrent.futures.as_completed(future_to_source):
+    # 각 크롤러 함수를 실행하고 Future 객체를 딕셔너리에 저장
+    executor = _get_executor(max_workers)
+    future_to_source = {}
+    still_running = []
+    for source, func in crawler_functions.items():
+        previous = _IN_FLIGHT.get(source)
+        if previous is not None and not previous.done():
+            still_running.append(source)
+            continue
+        future = executor.submit(func)
+        _IN_FLIGHT[source] = future
+        future_to_source[future] = source
+    if still_running:
+        logging.warning("이전 사이클의 크롤러가 아직 실행 중이어서 다음 소스를 이번 사이클에서 건너뜁니다: %s",
+                        ', '.join(source.upper() for source in still_running))
+    
+    # 제한 시간은 크롤러가 끝나는 시점만으로 판단합니다. 소비자가 yield에서 결과를 처리하는 동안
+    # 끝난 크롤러도 결과를 버리지 않도록, 매번 끝난 Future를 모두 내보낸 뒤 남은 시간만큼 다시 기다립니다.
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    pending = set(future_to_source)
+    while pending:
+        remaining = max(deadline - time.monotonic(), 0) if deadline is not None else None
+        done, pending = concurrent.futures.wait(pending, timeout=remaining,
+                                                return_when=concurrent.futures.FIRST_COMPLETED)
+        if not done:
+            # 대기 중인 크롤러는 취소하고, 이미 실행 중인 크롤러는 결과를 버립니다.
+            for future in pending:
+                future.cancel()
+            logging.warning("크롤링 제한 시간(%s초)을 초과하여 다음 소스를 이번 사이클에서 제외합니다: %s",
+                            timeout, ', '.join(future_to_source[future].upper() for future in pending))
+            return
+
+        for future in done:
             source = future_to_source[future]
             try:
                 # 각 Future의 결과를 가져옵니다 (크롤링 결과).
-                tickets = future.result()
-                if tickets:
-                    all_tickets.extend(tickets)
-                    logging.info(f"{source.upper()} 크롤링 완료: {len(tickets)}개 수집")
-                else:
-                    logging.info(f"{source.upper()} 크롤링 완료: 수집된 정보 없음")
+                tickets = future.result() or []
             except Exception as e:
-                logging.error(f"{source.upper()} 크롤링 중 오류 발생: {e}", exc_info=True)
-    
+                logging.error("%s 크롤링 중 오류 발생: %s", source.upper(), e, exc_info=True)
+                continue
+
+            if tickets:
+                logging.info("%s 크롤링 완료: %d개 수집", source.upper(), len(tickets))
+            else:
+                logging.info("%s 크롤링 완료: 수집된 정보 없음", source.upper())
+            yield source, tickets
+
+
+def collect_all_tickets(sources: List[str], max_workers: int = len(ALL_SOURCES),
+                        timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    모든 소스에서 티켓 정보를 병렬로 수집하여 하나의 리스트로 반환합니다.
+    """
+    all_tickets = []
+    for _, tickets in iter_collected_tickets(sources, max_workers, timeout):
+        all_tickets.extend(tickets)
     return all_tickets
 
 
-def monitor_tickets():
+def _send_notifications(discord_notifier: DiscordNotifier, tickets: List[Dict[str, Any]], delay: float,
+                        remaining_notifications: int, cycle_result: Dict[str, int], label: str) -> int:
+    """
+    사이클당 남은 알림 수 안에서 티켓 알림을 배치로 전송하고 결과를 cycle_result에 더합니다.
+    전송 후 남은 알림 수를 반환합니다.
+    """
+    if remaining_notifications <= 0:
+        logging.warning("이번 사이클의 알림 제한에 도달하여 %s 티켓 %d개를 다음 사이클로 미룹니다.", label, len(tickets))
+        return remaining_notifications
+
+    # 배치 알림 전송 (개선된 시스템 사용)
+    result = discord_notifier.send_batch_notifications(
+        tickets,
+        delay=delay,
+        max_per_batch=remaining_notifications
+    )
+    for key in cycle_result:
+        cycle_result[key] += result[key]
+    # 이미 전송된 티켓(스킵)은 제한에 포함하지 않습니다.
+    return remaining_notifications - (result['sent'] + result['failed'])
+
+
+def monitor_tickets(config: Dict[str, Any]):
     """
     티켓 정보를 주기적으로 모니터링하고 디스코드로 알림을 보냅니다.
     개선된 알림 시스템과 통계 기능을 포함합니다.
-    """
-    config = load_config()
     
+    Args:
+        config: load_config()로 읽어 온 설정 정보
+    """
     # 개선된 디스코드 알림기 초기화
     try:
         discord_notifier = setup_discord_notifier(config)
         logging.info("디스코드 알림기가 성공적으로 초기화되었습니다.")
     except Exception as e:
-        logging.error(f"디스코드 알림기 초기화 실패: {e}")
+        logging.error("디스코드 알림기 초기화 실패: %s", e)
         return
     
     logging.info("티켓 모니터링을 시작합니다...")
@@ -202,80 +330,104 @@ def monitor_tickets():
         'total_cycles': 0,
         'total_tickets_found': 0,
         'total_notifications_sent': 0,
-        'start_time': datetime.now()
+        'start_monotonic': time.monotonic()  # 가동시간은 출력할 때만 timedelta로 변환합니다.
     }
     
     while True:
         try:
             monitoring_stats['total_cycles'] += 1
-            cycle_start = datetime.now()
+            cycle_start = time.monotonic()
+            
+            logging.info("모니터링 사이클 #%d 시작", monitoring_stats['total_cycles'])
             
-            logging.info(f"모니터링 사이클 #{monitoring_stats['total_cycles']} 시작")
+            keywords = config.get('KEYWORDS', [])
+            batch_delay = config.get('notification_delay', 1.0)  # 기본 1초 지연
+            remaining_notifications = config.get('max_notifications_per_cycle', 10)  # 사이클당 기본 10개 제한
             
-            # 모든 소스에서 티켓 정보 수집
-            all_tickets = collect_all_tickets(config['sources'])
+            seen_links = set()
+            held_normal_tickets = []
+            cycle_found = 0
+            cycle_filtered = 0
+            cycle_result = {'sent': 0, 'failed': 0, 'skipped': 0}
             
-            if all_tickets:
-                monitoring_stats['total_tickets_found'] += len(all_tickets)
+            # 크롤러가 끝나는 대로 해당 소스의 우선순위 티켓을 바로 알립니다.
+            # 일반 티켓은 모든 크롤러가 끝난 뒤 보내, 먼저 끝난 소스의 일반 티켓이
+            # 느린 소스의 우선순위 티켓보다 사이클당 알림 제한을 먼저 차지하지 않게 합니다.
+            max_crawlers = config.get('max_concurrent_crawlers', len(ALL_SOURCES))  # 동시에 실행할 최대 크롤러 수
+            crawler_timeout = config.get('crawler_timeout', config.get('interval', 300))  # 사이클당 크롤링 제한 시간(초), 기본값은 사이클 간격
+            for source, collected_tickets in iter_collected_tickets(config['sources'], max_crawlers, crawler_timeout):
+                tickets = deduplicate_tickets(collected_tickets, seen_links)
+                if len(tickets) < len(collected_tickets):
+                    logging.debug("%s: 링크 기준 중복 티켓 %d개를 제거했습니다.", source.upper(), len(collected_tickets) - len(tickets))
+                if not tickets:
+                    continue
+                cycle_found += len(tickets)
                 
                 # 키워드로 필터링 (디스코드 알림기에서도 추가 필터링 수행)
-                filtered_tickets = filter_tickets_by_keyword(all_tickets, config.get('KEYWORDS', []))
+                filtered_tickets = filter_tickets_by_keyword(tickets, keywords)
+                if not filtered_tickets:
+                    continue
+                cycle_filtered += len(filtered_tickets)
+                logging.info("%s에서 필터링된 티켓 %d개를 발견했습니다.", source.upper(), len(filtered_tickets))
                 
-                if filtered_tickets:
-                    logging.info(f"필터링된 티켓 {len(filtered_tickets)}개를 발견했습니다.")
-                    
-                    # 배치 알림 전송 (개선된 시스템 사용)
-                    batch_delay = config.get('notification_delay', 1.0)  # 기본 1초 지연
-                    max_batch_size = config.get('max_notifications_per_cycle', 10)  # 기본 10개 제한
-                    
-                    result = discord_notifier.send_batch_notifications(
-                        filtered_tickets, 
-                        delay=batch_delay,
-                        max_per_batch=max_batch_size
-                    )
-                    
-                    monitoring_stats['total_notifications_sent'] += result['sent']
-                    
-                    # 결과 로깅
-                    if result['sent'] > 0:
-                        logging.info(f"알림 전송 완료: 성공 {result['sent']}개, 스킵 {result['skipped']}개, 실패 {result['failed']}개")
+                priority_tickets = []
+                for ticket in filtered_tickets:
+                    if discord_notifier.is_priority_ticket(ticket):
+                        priority_tickets.append(ticket)
                     else:
-                        logging.info("새로운 티켓이 없거나 모든 알림이 스킵되었습니다.")
-                        
-                    # 통계 정보 출력 (매 10사이클마다)
-                    if monitoring_stats['total_cycles'] % 10 == 0:
-                        stats = discord_notifier.get_notification_stats()
-                        uptime = datetime.now() - monitoring_stats['start_time']
-                        logging.info(f"모니터링 통계 - 가동시간: {uptime}, 총 사이클: {monitoring_stats['total_cycles']}, "
-                                   f"오늘 알림: {stats['today_count']}개, 총 알림: {stats['total_count']}개")
-                        
-                else:
-                    logging.info("키워드 조건에 맞는 티켓이 없습니다.")
-            else:
+                        held_normal_tickets.append(ticket)
+                if priority_tickets:
+                    remaining_notifications = _send_notifications(discord_notifier, priority_tickets, batch_delay,
+                                                                  remaining_notifications, cycle_result, source.upper())
+            
+            if held_normal_tickets:
+                _send_notifications(discord_notifier, held_normal_tickets, batch_delay,
+                                    remaining_notifications, cycle_result, "일반")
+            
+            monitoring_stats['total_tickets_found'] += cycle_found
+            monitoring_stats['total_notifications_sent'] += cycle_result['sent']
+            
+            # 결과 로깅
+            if not cycle_found:
                 logging.info("수집된 티켓이 없습니다.")
+            elif not cycle_filtered:
+                logging.info("키워드 조건에 맞는 티켓이 없습니다.")
+            elif cycle_result['sent'] > 0:
+                logging.info("알림 전송 완료: 성공 %d개, 스킵 %d개, 실패 %d개", cycle_result['sent'], cycle_result['skipped'], cycle_result['failed'])
+            else:
+                logging.info("새로운 티켓이 없거나 모든 알림이 스킵되었습니다.")
+            
+            # 통계 정보 출력 (매 10사이클마다)
+            if monitoring_stats['total_cycles'] % 10 == 0:
+                stats = discord_notifier.get_notification_stats()
+                uptime = timedelta(seconds=int(time.monotonic() - monitoring_stats['start_monotonic']))
+                logging.info("모니터링 통계 - 가동시간: %s, 총 사이클: %d, 오늘 알림: %d개, 총 알림: %d개",
+                             uptime, monitoring_stats['total_cycles'], stats['today_count'], stats['total_count'])
             
-            # 사이클 완료 시간 계산
-            cycle_duration = (datetime.now() - cycle_start).total_seconds()
+            # 사이클 완료 시간 계산 (시스템 시각 변경에 영향받지 않는 단조 시계 사용)
+            cycle_duration = time.monotonic() - cycle_start
             
             # 다음 실행까지 대기
             interval = config.get('interval', 300)  # 기본 5분
-            actual_wait = max(0, interval - cycle_duration)  # 실행 시간을 고려한 대기 시간
+            jitter = config.get('interval_jitter', 60)  # 요청 시점을 흩뜨리기 위한 최대 지연(초)
+            if cycle_duration >= interval:
+                logging.warning("사이클 실행 시간(%.1f초)이 설정된 간격(%s초)을 초과했습니다.", cycle_duration, interval)
+            actual_wait = max(0, interval - cycle_duration) + random.random() * jitter  # 실행 시간을 고려한 대기 시간
             
             if actual_wait > 0:
-                logging.info(f"사이클 완료 (소요시간: {cycle_duration:.1f}초). {actual_wait:.0f}초 후 다시 확인합니다.")
+                logging.info("사이클 완료 (소요시간: %.1f초). %.0f초 후 다시 확인합니다.", cycle_duration, actual_wait)
                 time.sleep(actual_wait)
-            else:
-                logging.warning(f"사이클 실행 시간({cycle_duration:.1f}초)이 설정된 간격({interval}초)을 초과했습니다.")
             
         except KeyboardInterrupt:
             logging.info("사용자 요청으로 모니터링을 중단합니다.")
             # 최종 통계 출력
-            uptime = datetime.now() - monitoring_stats['start_time']
-            logging.info(f"최종 통계 - 가동시간: {uptime}, 총 사이클: {monitoring_stats['total_cycles']}, "
-                       f"발견된 티켓: {monitoring_stats['total_tickets_found']}개, 전송된 알림: {monitoring_stats['total_notifications_sent']}개")
+            uptime = timedelta(seconds=int(time.monotonic() - monitoring_stats['start_monotonic']))
+            logging.info("최종 통계 - 가동시간: %s, 총 사이클: %d, 발견된 티켓: %d개, 전송된 알림: %d개",
+                         uptime, monitoring_stats['total_cycles'],
+                         monitoring_stats['total_tickets_found'], monitoring_stats['total_notifications_sent'])
             break
         except Exception as e:
-            logging.error(f"모니터링 중 오류 발생: {e}")
+            logging.error("모니터링 중 오류 발생: %s", e)
             logging.info("60초 후 재시도합니다.")
             time.sleep(60)  # 오류 발생 시 1분 대기 후 재시도
 
@@ -289,7 +441,7 @@ def main():
     config = load_config()
     
     # 모니터링 시작
-    monitor_tickets()
+    monitor_tickets(config)
 
 
 if __name__ == "__main__":
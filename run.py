@@ -10,17 +10,19 @@
 5. 콘솔에 처리 결과를 출력합니다.
 """
 
-import json
 from datetime import datetime
+from functools import lru_cache
 import os
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # 크롤러 함수 임포트
 from crawlers.interpark_crawler import get_interpark_notices
 from crawlers.yes24_crawler import get_yes24_notices
 from crawlers.melon_crawler import get_melon_notices
 from crawlers.ticketlink_crawler import get_ticketlink_notices
+from data_manager import json_dumps
 
 # --- 데이터 폴더 관리 ---
 DATA_DIR = "data"
@@ -41,48 +43,62 @@ def collect_all_tickets():
     """
     logging.info("모든 티켓 사이트의 정보 수집을 시작합니다...")
     
-    # 각 크롤러를 병렬로 실행하면 더 효율적일 수 있으나, 우선 순차적으로 실행합니다.
-    interpark_tickets = get_interpark_notices()
-    yes24_tickets = get_yes24_notices()
-    melon_tickets = get_melon_notices()
-    ticketlink_tickets = get_ticketlink_notices()
-    
-    # 모든 결과를 하나의 리스트로 통합합니다.
-    all_tickets = interpark_tickets + yes24_tickets + melon_tickets + ticketlink_tickets
+    # 각 크롤러는 서로 다른 사이트를 기다리는 I/O 작업이므로 병렬로 실행합니다.
+    crawlers = {
+        "interpark": get_interpark_notices,
+        "yes24": get_yes24_notices,
+        "melon": get_melon_notices,
+        "ticketlink": get_ticketlink_notices,
+    }
+    all_tickets = []
+    with ThreadPoolExecutor(max_workers=len(crawlers)) as executor:
+        future_to_source = {executor.submit(crawler): source for source, crawler in crawlers.items()}
+        
+        # 먼저 끝난 크롤러의 결과부터 하나의 리스트로 통합합니다.
+        for future in as_completed(future_to_source):
+            source = future_to_source[future]
+            try:
+                tickets = future.result() or []
+            except Exception as e:
+                # 한 사이트의 실패가 다른 사이트의 수집 결과까지 버리지 않도록 합니다.
+                logging.error(f"{source.upper()} 크롤링 중 오류 발생: {e}", exc_info=True)
+                continue
+            logging.info(f"{source.upper()} 크롤링 완료: {len(tickets)}건 수집")
+            all_tickets.extend(tickets)
     
     logging.info(f"크롤링 완료! 총 {len(all_tickets)}건의 티켓 정보를 수집했습니다.")
     return all_tickets
 
 # --- 데이터 정제 및 필터링 ---
-def parse_date(date_str):
-    """
-    다양한 형식의 날짜 문자열을 파싱하여 datetime 객체로 변환합니다.
-    정확한 시간 정보가 없으면 기본값으로 자정을 사용합니다.
+# 일반적인 날짜 형식에 대한 정규 표현식 패턴 (호출마다 다시 컴파일하지 않도록 미리 컴파일합니다)
+DATE_PATTERNS = [
+    # YYYY.MM.DD HH:MM
+    (re.compile(r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})'), 5),
+    # YYYY.MM.DD
+    (re.compile(r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})'), 3),
+    # MM.DD HH:MM
+    (re.compile(r'(\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})'), 4),
+    # MM월 DD일 HH시 MM분
+    (re.compile(r'(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시\s*(\d{1,2})분'), 4),
+]
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str, current_year):
+    """
+    parse_date의 실제 파싱 로직입니다. 같은 날짜 문자열은 한 번만 파싱하도록 결과를 캐시합니다.
+    연도가 없는 형식은 current_year를 사용하므로, 연도가 바뀌면 캐시 키도 달라집니다.
     """
     try:
-        # 일반적인 날짜 형식에 대한 정규 표현식 패턴
-        patterns = [
-            # YYYY.MM.DD HH:MM
-            (r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})', 5),
-            # YYYY.MM.DD
-            (r'(\d{4})[\.\-/](\d{1,2})[\.\-/](\d{1,2})', 3),
-            # MM.DD HH:MM
-            (r'(\d{1,2})[\.\-/](\d{1,2})[\s]+(\d{1,2}):(\d{1,2})', 4),
-            # MM월 DD일 HH시 MM분
-            (r'(\d{1,2})월\s*(\d{1,2})일\s*(\d{1,2})시\s*(\d{1,2})분', 4),
-        ]
-        
-        for pattern, group_count in patterns:
-            match = re.search(pattern, date_str)
+        for pattern, group_count in DATE_PATTERNS:
+            match = pattern.search(date_str)
             if match:
                 groups = match.groups()
-                now = datetime.now()
                 if group_count == 5:  # YYYY.MM.DD HH:MM
                     return datetime(int(groups[0]), int(groups[1]), int(groups[2]), int(groups[3]), int(groups[4]))
                 elif group_count == 3:  # YYYY.MM.DD
                     return datetime(int(groups[0]), int(groups[1]), int(groups[2]))
                 elif group_count == 4:  # MM.DD HH:MM or MM월 DD일 HH시 MM분
-                    return datetime(now.year, int(groups[0]), int(groups[1]), int(groups[2]), int(groups[3]))
+                    return datetime(current_year, int(groups[0]), int(groups[1]), int(groups[2]), int(groups[3]))
         
         # 알려진 패턴과 일치하지 않을 경우, 파싱 실패를 알립니다.
         logging.warning(f"날짜 형식을 파싱할 수 없습니다: '{date_str}'")
@@ -91,6 +107,13 @@ def parse_date(date_str):
         logging.error(f"날짜 파싱 중 예외 발생 - {e}, 입력: '{date_str}'")
         return datetime.max
 
+def parse_date(date_str):
+    """
+    다양한 형식의 날짜 문자열을 파싱하여 datetime 객체로 변환합니다.
+    정확한 시간 정보가 없으면 기본값으로 자정을 사용합니다.
+    """
+    return _parse_date_cached(date_str, datetime.now().year)
+
 def sort_by_date(tickets):
     """
     티켓 정보를 오픈 날짜순으로 정렬합니다.
@@ -109,9 +132,9 @@ def search_tickets_by_keyword(tickets, keyword):
     """
     지정된 키워드가 제목에 포함된 티켓을 검색합니다. (대소문자 무시)
     """
-    if not keyword:
+    if not keyword or not tickets:
         return tickets
-    
+
     keyword = keyword.lower()
     logging.info(f"'{keyword}' 키워드로 티켓을 검색합니다.")
     return [ticket for ticket in tickets if keyword in ticket.get('title', '').lower()]
@@ -136,8 +159,8 @@ def save_tickets_to_json(tickets, filename):
     티켓 정보를 지정된 파일 이름으로 JSON 형식으로 저장합니다.
     """
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(tickets, f, ensure_ascii=False, indent=2)
+        with open(filename, "wb") as f:
+            f.write(json_dumps(tickets, indent=True))
         logging.info(f"티켓 정보가 '{filename}' 파일에 성공적으로 저장되었습니다.")
     except IOError as e:
         logging.error(f"'{filename}' 파일에 쓰는 중 에러가 발생했습니다 - {e}")
@@ -179,8 +202,12 @@ def main():
     save_tickets_to_json(all_tickets, ALL_TICKETS_FILE)
     
     # sent_notifications.json 파일은 알림 발송 시 생성/사용되므로, 여기서는 빈 파일을 생성해 둘 수 있습니다.
-    if not os.path.exists(SENT_NOTIFICATIONS_FILE):
-        save_tickets_to_json([], SENT_NOTIFICATIONS_FILE)
+    # 'x' 모드는 파일이 없을 때만 생성하므로 존재 확인과 생성 사이의 경쟁 조건이 없습니다.
+    try:
+        with open(SENT_NOTIFICATIONS_FILE, "x", encoding="utf-8") as f:
+            f.write("[]")
+    except FileExistsError:
+        pass
 
     logging.info("모든 작업이 완료되었습니다. 시스템을 종료합니다.")
     logging.info("="*80)
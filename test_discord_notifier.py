@@ -0,0 +1,107 @@
+"""
+디스코드 알림 배치 전송 검증 테스트
+웹훅 요청은 실제로 보내지 않고, 디스코드 응답을 흉내 내는 가짜 세션으로 대체합니다.
+"""
+import pytest
+import requests
+
+import discord_notifier
+from discord_notifier import DiscordNotifier
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            error = requests.exceptions.HTTPError(f"{self.status_code} Error")
+            error.response = self
+            raise error
+
+
+class FakeDiscordSession:
+    """url이 http로 시작하지 않는 임베드가 하나라도 있으면 디스코드처럼 메시지 전체를 400으로 거부합니다."""
+
+    def __init__(self):
+        self.payloads = []
+
+    def post(self, url, json, timeout):
+        self.payloads.append(json)
+        for embed in json["embeds"]:
+            if "url" in embed and not embed["url"].startswith("http"):
+                return FakeResponse(400)
+        return FakeResponse(204)
+
+
+def make_ticket(i, link):
+    return {"source": "YES24", "title": f"공연 {i}", "open_date": "2025.01.01 20:00", "link": link}
+
+
+@pytest.fixture
+def notifier(tmp_path, monkeypatch):
+    # 전송 기록 파일은 임시 디렉토리의 data/ 아래에 저장합니다.
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(discord_notifier.time, "sleep", lambda seconds: None)
+    notifier = DiscordNotifier("https://discord.com/api/webhooks/test")
+    notifier.session = FakeDiscordSession()
+    return notifier
+
+
+def test_placeholder_link_is_not_sent_as_embed_url(notifier):
+    embed = notifier.create_embed(make_ticket(0, "링크 없음"))
+    assert "url" not in embed
+
+    embed = notifier.create_embed(make_ticket(1, "https://ticket.yes24.com/1"))
+    assert embed["url"] == "https://ticket.yes24.com/1"
+
+
+def test_mixed_chunk_is_delivered_in_one_message(notifier):
+    tickets = [make_ticket(i, f"https://ticket.yes24.com/{i}") for i in range(5)]
+    tickets.append(make_ticket(5, "링크 없음"))
+
+    result = notifier.send_batch_notifications(tickets, max_per_batch=10)
+
+    assert result == {"sent": 6, "failed": 0, "skipped": 0}
+    assert len(notifier.session.payloads) == 1
+    assert len(notifier.session.payloads[0]["embeds"]) == 6
+
+    # 전송된 티켓은 다음 사이클에서 다시 보내지 않습니다.
+    assert notifier.send_batch_notifications(tickets, max_per_batch=10) == {"sent": 0, "failed": 0, "skipped": 6}
+
+
+def test_rejected_chunk_falls_back_to_per_ticket_sends(notifier, monkeypatch):
+    tickets = [make_ticket(i, f"https://ticket.yes24.com/{i}") for i in range(5)]
+    tickets.append(make_ticket(5, "링크 없음"))
+
+    # 잘못된 url이 그대로 임베드에 들어가 메시지 전체가 거부되는 상황을 만듭니다.
+    original_create_embed = notifier.create_embed
+
+    def create_embed_with_raw_link(ticket):
+        embed = original_create_embed(ticket)
+        embed["url"] = ticket["link"]
+        return embed
+
+    monkeypatch.setattr(notifier, "create_embed", create_embed_with_raw_link)
+
+    result = notifier.send_batch_notifications(tickets, max_per_batch=10)
+
+    # 문제 티켓 하나만 실패하고 나머지는 개별 전송으로 전달됩니다.
+    assert result == {"sent": 5, "failed": 1, "skipped": 0}
+    assert notifier.send_batch_notifications(tickets, max_per_batch=10) == {"sent": 0, "failed": 1, "skipped": 5}
+
+
+def test_unusable_webhook_fails_chunk_without_per_ticket_sends(notifier, monkeypatch):
+    tickets = [make_ticket(i, f"https://ticket.yes24.com/{i}") for i in range(8)]
+
+    # 삭제된 웹훅은 어떤 요청이든 404로 응답합니다.
+    def post_to_deleted_webhook(url, json, timeout):
+        notifier.session.payloads.append(json)
+        return FakeResponse(404)
+
+    monkeypatch.setattr(notifier.session, "post", post_to_deleted_webhook)
+
+    result = notifier.send_batch_notifications(tickets, max_per_batch=10)
+
+    assert result == {"sent": 0, "failed": 8, "skipped": 0}
+    assert len(notifier.session.payloads) == 1
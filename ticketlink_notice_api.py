@@ -18,22 +18,75 @@ sess.headers.update({
     "Referer": f"{BASE}/help/notice"
 })
 
+# URL별 ETag / Last-Modified 캐시 (변경 없는 목록은 304로 건너뜀)
+HTTP_CACHE_FILE = os.path.join("data", "http_cache.json")
+
+def load_http_cache():
+    try:
+        with open(HTTP_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_http_cache(cache):
+    try:
+        os.makedirs("data", exist_ok=True)
+        with open(HTTP_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False, indent=2)
+    except Exception as e:
+        print(f"✗ HTTP 캐시 저장 실패: {str(e)}")
+
+http_cache = load_http_cache()
+
+def conditional_get(url, params=None):
+    """
+    저장된 ETag / Last-Modified로 조건부 GET 요청을 보냅니다.
+    (응답 객체, 새 검증값) 튜플을 반환하며, 서버가 304 Not Modified를 반환하면 응답 객체는 None입니다.
+    새 검증값은 여기서 저장하지 않습니다. 응답 처리가 끝난 뒤 호출한 쪽에서 http_cache에 반영해야
+    처리 도중 실패해도 다음 실행이 304로 건너뛰지 않습니다.
+    """
+    cache_key = requests.Request("GET", url, params=params).prepare().url
+    entry = http_cache.get(cache_key, {})
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    res = sess.get(url, params=params, headers=headers, timeout=10)
+    if res.status_code == 304:
+        return None, {}
+
+    res.raise_for_status()
+    validators = {"etag": res.headers.get("ETag"), "last_modified": res.headers.get("Last-Modified")}
+    return res, ({cache_key: validators} if any(validators.values()) else {})
+
 def fetch_list(page=1, category="", keyword=""):
+    """
+    (공지사항 목록, 새 검증값) 튜플을 반환합니다. 이전 요청 이후 변경이 없으면 목록은 None입니다.
+    새 검증값은 수집 결과를 저장한 뒤 http_cache에 반영합니다.
+    """
     try:
         print(f"📋 공지사항 목록 요청 중... (페이지: {page})")
-        res = sess.get(LIST_API,
-                       params={"page": page,
-                               "noticeCategoryCode": category,
-                               "title": keyword.replace(" ", "") if keyword else None},
-                       timeout=10).json()
-        items = res["result"]["result"]
+        res, validators = conditional_get(LIST_API,
+                                          params={"page": page,
+                                                  "noticeCategoryCode": category,
+                                                  "title": keyword.replace(" ", "") if keyword else None})
+        if res is None:
+            print("📋 이전 요청 이후 변경된 공지사항이 없습니다. (304 Not Modified)")
+            return None, {}
+        items = res.json()["result"]["result"]
         print(f"📋 {len(items)}개의 공지사항을 찾았습니다.")
-        return items
+        return items, validators
     except Exception as e:
         print(f"✗ 공지사항 목록 요청 실패: {str(e)}")
-        return []
+        return [], {}
 
 def fetch_detail(nid):
+    """
+    (공지사항 정보, 성공 여부) 튜플을 반환합니다.
+    수집에 실패하면 오류 내용을 담은 공지사항 정보와 False를 반환합니다.
+    """
     url = f"{BASE}/help/notice/{nid}"
     try:
         html = sess.get(url, timeout=10).text
@@ -48,27 +101,33 @@ def fetch_detail(nid):
         body = body_element.get_text("\n", strip=True) if body_element else "본문을 찾을 수 없습니다."
         
         print(f"✓ 공지사항 {nid} 수집 완료: {title[:50]}...")
-        return {"id": nid, "title": title, "body": body, "url": url}
+        return {"id": nid, "title": title, "body": body, "url": url}, True
         
     except Exception as e:
         print(f"✗ 공지사항 {nid} 수집 실패: {str(e)}")
-        return {"id": nid, "title": f"오류 (ID: {nid})", "body": f"수집 실패: {str(e)}", "url": url}
+        return {"id": nid, "title": f"오류 (ID: {nid})", "body": f"수집 실패: {str(e)}", "url": url}, False
 
 def job():
     print(f"\n🚀 티켓링크 공지사항 수집 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    items = fetch_list(page=1, category="", keyword="")
+    items, validators = fetch_list(page=1, category="", keyword="")
+    if items is None:
+        print("⏭️ 목록이 변경되지 않아 이번 수집을 건너뜁니다.")
+        return
     if not items:
         print("❌ 수집할 공지사항이 없습니다.")
         return
     
     saved = []
+    failed = 0
     total = len(items)
     
     for i, it in enumerate(items, 1):
         print(f"\n[{i}/{total}] 공지사항 수집 중...")
-        d = fetch_detail(it["noticeId"])
+        d, ok = fetch_detail(it["noticeId"])
         saved.append(d)
+        if not ok:
+            failed += 1
         time.sleep(0.3)  # 서버 부하 방지를 위한 지연
     
     # 결과 저장
@@ -80,6 +139,12 @@ def job():
         with open(filename, "w", encoding="utf-8") as f:
             json.dump(saved, f, ensure_ascii=False, indent=2)
         print(f"\n✅ 수집 완료! {len(saved)}건의 공지사항을 '{filename}'에 저장했습니다.")
+        # 모든 공지사항을 수집해 저장한 뒤에만 검증값을 기록해, 실패한 공지사항을 다음 실행에서 다시 수집합니다.
+        if failed:
+            print(f"⚠️ {failed}건의 공지사항 수집에 실패하여 다음 실행에서 목록을 다시 요청합니다.")
+        elif validators:
+            http_cache.update(validators)
+            save_http_cache(http_cache)
     except Exception as e:
         print(f"\n❌ 파일 저장 실패: {str(e)}")
     
@@ -91,4 +156,6 @@ if __name__ == "__main__":
     job()                                                        # 첫 실행
     while True:
         schedule.run_pending()
-        time.sleep(1)
+        # 매초 깨어나 확인하지 않고 다음 작업 예정 시각까지 잠듭니다.
+        idle = schedule.idle_seconds()
+        time.sleep(max(idle, 0) if idle is not None else 1)
@@ -62,6 +62,36 @@ ADMIN_USERS = {"admin", "manager"}  # 관리자 권한을 가진 사용자 목
 # 자동 갱신 설정
 AUTO_REFRESH_INTERVAL = 3600  # 1시간 (초 단위)
 
+# 장르별 제목 키워드 (앞에서부터 먼저 일치하는 장르로 분류)
+GENRE_KEYWORDS = {
+    "콘서트": ('콘서트', 'concert', '공연'),
+    "뮤지컬": ('뮤지컬', 'musical'),
+    "연극": ('연극', 'play'),
+    "클래식": ('클래식', 'classic', '오케스트라'),
+}
+DEFAULT_GENRE = "기타"
+
+# 하루 단위 날짜 필터와 오늘 기준 날짜 차이 (일)
+DAY_FILTER_OFFSETS = {
+    "today": 0,
+    "tomorrow": 1,
+}
+
+def _classify_genre(title: str) -> str:
+    """
+    소문자로 변환된 제목에서 장르를 분류합니다.
+    
+    Args:
+        title: 소문자로 변환된 티켓 제목
+        
+    Returns:
+        장르 이름 (일치하는 장르가 없으면 DEFAULT_GENRE)
+    """
+    for genre, keywords in GENRE_KEYWORDS.items():
+        if any(keyword in title for keyword in keywords):
+            return genre
+    return DEFAULT_GENRE
+
 def get_ticket_stats(tickets: List[Dict]) -> Dict[str, Any]:
     """
     티켓 통계 정보를 계산합니다.
@@ -84,18 +114,9 @@ def get_ticket_stats(tickets: List[Dict]) -> Dict[str, Any]:
     
     # 플랫폼별 카운트
     platform_counts = {}
-    for ticket in tickets:
-        platform = ticket.get('source', '알 수 없음')
-        platform_counts[platform] = platform_counts.get(platform, 0) + 1
     
     # 장르별 카운트 (제목에서 추출)
-    genre_counts = {
-        "콘서트": 0,
-        "뮤지컬": 0,
-        "연극": 0,
-        "클래식": 0,
-        "기타": 0
-    }
+    genre_counts = dict.fromkeys([*GENRE_KEYWORDS, DEFAULT_GENRE], 0)
     
     today = datetime.now().date()
     tomorrow = today + timedelta(days=1)
@@ -105,20 +126,15 @@ def get_ticket_stats(tickets: List[Dict]) -> Dict[str, Any]:
     tomorrow_count = 0
     this_week_count = 0
     
+    # 플랫폼, 장르, 날짜별 통계를 티켓 목록 한 번 순회로 모두 계산합니다.
     for ticket in tickets:
+        platform = ticket.get('source', '알 수 없음')
+        platform_counts[platform] = platform_counts.get(platform, 0) + 1
+        
         title = ticket.get('title', '').lower()
         
         # 장르 분류
-        if any(keyword in title for keyword in ['콘서트', 'concert', '공연']):
-            genre_counts["콘서트"] += 1
-        elif any(keyword in title for keyword in ['뮤지컬', 'musical']):
-            genre_counts["뮤지컬"] += 1
-        elif any(keyword in title for keyword in ['연극', 'play']):
-            genre_counts["연극"] += 1
-        elif any(keyword in title for keyword in ['클래식', 'classic', '오케스트라']):
-            genre_counts["클래식"] += 1
-        else:
-            genre_counts["기타"] += 1
+        genre_counts[_classify_genre(title)] += 1
         
         # 날짜별 카운트
         open_date_str = ticket.get('open_date', '')
@@ -203,15 +219,8 @@ async def get_tickets(
     
     # 장르 필터
     if genre and genre != "전체":
-        genre_keywords = {
-            "콘서트": ['콘서트', 'concert', '공연'],
-            "뮤지컬": ['뮤지컬', 'musical'],
-            "연극": ['연극', 'play'],
-            "클래식": ['클래식', 'classic', '오케스트라']
-        }
-        
-        if genre in genre_keywords:
-            keywords = genre_keywords[genre]
+        if genre in GENRE_KEYWORDS:
+            keywords = GENRE_KEYWORDS[genre]
             filtered_tickets = [
                 t for t in filtered_tickets 
                 if any(keyword in t.get('title', '').lower() for keyword in keywords)
@@ -221,25 +230,20 @@ async def get_tickets(
     if date_filter:
         today = datetime.now().date()
         
-        if date_filter == "today":
-            target_date = today
-        elif date_filter == "tomorrow":
-            target_date = today + timedelta(days=1)
-        elif date_filter == "week":
-            # 이번 주 필터링은 별도 로직 필요
-            week_end = today + timedelta(days=7)
+        if date_filter in DAY_FILTER_OFFSETS:
+            target_date = today + timedelta(days=DAY_FILTER_OFFSETS[date_filter])
             filtered_tickets = [
                 t for t in filtered_tickets
-                if _parse_ticket_date(t.get('open_date', '')) and
-                   today <= _parse_ticket_date(t.get('open_date', '')) <= week_end
+                if _parse_ticket_date(t.get('open_date', '')) == target_date
             ]
-        else:
-            target_date = None
-        
-        if date_filter in ["today", "tomorrow"] and target_date:
+        elif date_filter == "week":
+            # 이번 주 필터링은 별도 로직 필요
+            week_end = today + timedelta(days=7)
+            # 티켓마다 날짜를 한 번만 파싱합니다.
             filtered_tickets = [
                 t for t in filtered_tickets
-                if _parse_ticket_date(t.get('open_date', '')) == target_date
+                if (open_date := _parse_ticket_date(t.get('open_date', ''))) and
+                   today <= open_date <= week_end
             ]
     
     # 검색어 필터